@@ -15,6 +15,8 @@ Usage:
     wave3ctl gain <0-100>        Set microphone gain
     wave3ctl monitor             Watch for knob / button changes
     wave3ctl discover            Probe Feature Unit controls
+    wave3ctl --daemon            Keep the device open and serve other
+                                 invocations over /run/wave3ctl.sock
 """
 
 from __future__ import annotations
@@ -22,17 +24,32 @@ from __future__ import annotations
 import errno
 import fcntl
 import os
+import socket
 import struct
 import sys
 import time
+import traceback
+from functools import cached_property
 
 # ── Constants ────────────────────────────────────────────────────────────
 
 # Must match the kernel module's struct + ioctl number
-_XFER_FMT = "<BBHHH64s"  # 72 bytes packed
-_XFER_SIZE = struct.calcsize(_XFER_FMT)  # 72
+# 8-byte header, 8 reserved bytes so data[] starts 16-byte aligned, data[64]
+_XFER_STRUCT = struct.Struct("<BBHHH8x64s")  # 80 bytes packed
+_XFER_SIZE = _XFER_STRUCT.size  # 80
+_XFER_DATA = 16  # offset of data[]
 _WAVE3_CTL = (3 << 30) | (_XFER_SIZE << 16) | (ord("W") << 8) | 0
 
+# Batched transfers: u8 n, 15 reserved bytes, then up to 8 xfer structs
+_BATCH_MAX = 8
+_BATCH_HDR = 16
+_BATCH_SIZE = _BATCH_HDR + _BATCH_MAX * _XFER_SIZE  # 656
+_WAVE3_CTL_BATCH = (3 << 30) | (_BATCH_SIZE << 16) | (ord("W") << 8) | 1
+
+# Short reads: the 8-byte xfer header alone, value returned by the ioctl
+_READ16_STRUCT = struct.Struct("<BBHHH")  # 8 bytes packed
+_WAVE3_READ16 = (3 << 30) | (_READ16_STRUCT.size << 16) | (ord("W") << 8) | 2
+
 # USB Audio Class 1.0
 _GET_CUR, _SET_CUR = 0x81, 0x01
 _GET_MIN, _GET_MAX, _GET_RES = 0x82, 0x83, 0x84
@@ -48,10 +65,39 @@ _HP_FU = 5  # headphone output
 _MIC_FU = 6  # microphone input
 _AC_IF = 0  # AudioControl interface
 
+# Precomputed wValue (selector << 8 | channel 0) and wIndex (entity << 8 | if)
+_WV_MUTE = _MUTE << 8
+_WV_VOLUME = _VOLUME << 8
+_WI_HP = (_HP_FU << 8) | _AC_IF
+_WI_MIC = (_MIC_FU << 8) | _AC_IF
+
+# Monitor poll period, seconds
+_POLL_INTERVAL = 0.2
+
+# Daemon socket (see --daemon)
+_SOCK_PATH = "/run/wave3ctl.sock"
+_SD_LISTEN_FDS_START = 3  # first fd handed over by systemd socket activation
+_SOCK_TIMEOUT = 1.0  # seconds, for handing a request to the daemon
+# One-shot commands the daemon runs; anything else always runs directly
+_DAEMON_CMDS = frozenset({"status", "discover", "mute", "volume", "gain"})
+
+# Pre-compiled accessors for the hot paths
+_LEN_STRUCT = struct.Struct("<H")  # xfer.length at offset 6
+_S16 = struct.Struct("<h")  # volume / gain values
+
+
+def _as_s16(v: int) -> int:
+    """Reinterpret an unsigned 16-bit value as signed."""
+    return (v ^ 0x8000) - 0x8000
+
 
 def _die(msg: str) -> None:
-    print(f"error: {msg}", file=sys.stderr)
-    sys.exit(1)
+    # Nothing needs cleaning up on the way out (the kernel closes the fd), so
+    # skip the stderr text stack and interpreter shutdown; only flush stdout
+    # so whatever was printed before the error isn't lost.
+    sys.stdout.flush()
+    os.write(2, f"error: {msg}\n".encode())
+    os._exit(1)
 
 
 # ── /dev/wave3ctl low-level interface ────────────────────────────────────
@@ -61,6 +107,18 @@ class _DevProxy:
     """Talks to the kernel module via /dev/wave3ctl."""
 
     def __init__(self) -> None:
+        # One transfer buffer, reused for every ioctl
+        self._buf = bytearray(_XFER_SIZE)
+        self._mv = memoryview(self._buf)
+        self._batch_buf = bytearray(_BATCH_SIZE)
+        self._batch_mv = memoryview(self._batch_buf)
+        # int16 view of the batch buffer; every xfer's data[] is 16-byte aligned.
+        # cast() is native-endian: like the kernel's native-endian struct
+        # fields, this assumes a little-endian host (x86, arm64).
+        self._batch_h = self._batch_mv.cast("h")
+        self._read16_buf = bytearray(_READ16_STRUCT.size)
+        # Bound once: saves the fcntl module-attribute lookup per transfer
+        self._fcntl_ioctl = fcntl.ioctl
         try:
             self._fd = os.open("/dev/wave3ctl", os.O_RDWR)
         except FileNotFoundError:
@@ -74,61 +132,150 @@ class _DevProxy:
     def close(self) -> None:
         os.close(self._fd)
 
-    def ctrl_transfer(
-        self,
-        request_type: int,
-        request: int,
-        value: int,
-        index: int,
-        data_or_len: int | bytes,
-    ) -> bytes:
-        if isinstance(data_or_len, int):
-            length = data_or_len
-            data_pad = b"\x00" * 64
-        else:
-            length = len(data_or_len)
-            data_pad = bytes(data_or_len) + b"\x00" * (64 - len(data_or_len))
-
-        buf = bytearray(
-            struct.pack(
-                _XFER_FMT, request_type, request, value, index, length, data_pad
-            )
-        )
-
+    def _ioctl(self, num: int, buf: bytearray) -> int:
         try:
-            fcntl.ioctl(self._fd, _WAVE3_CTL, buf)
+            return self._fcntl_ioctl(self._fd, num, buf)
         except OSError as e:
             if e.errno == errno.ENODEV:
                 _die("Wave:3 not found — is it connected?")
+            if e.errno == errno.ENOTTY:
+                _die("kernel module is out of date — rebuild and reload it")
             raise
 
-        resp_len = struct.unpack_from("<H", buf, 6)[0]
-        return bytes(buf[8 : 8 + resp_len])
+    def ctrl_read(
+        self, request_type: int, request: int, value: int, index: int, length: int
+    ) -> memoryview:
+        """IN transfer; the returned view is only valid until the next one."""
+        # "64s" zero-fills the unused tail of data[], so nothing is padded here
+        buf = self._buf
+        _XFER_STRUCT.pack_into(buf, 0, request_type, request, value, index, length, b"")
+        self._ioctl(_WAVE3_CTL, buf)
+
+        resp_len = _LEN_STRUCT.unpack_from(buf, 6)[0]
+        return self._mv[_XFER_DATA : _XFER_DATA + resp_len]
+
+    def ctrl_write(
+        self, request_type: int, request: int, value: int, index: int, data: bytes
+    ) -> None:
+        buf = self._buf
+        _XFER_STRUCT.pack_into(
+            buf, 0, request_type, request, value, index, len(data), data
+        )
+        self._ioctl(_WAVE3_CTL, buf)
+
+    def read16(
+        self, request_type: int, request: int, value: int, index: int, length: int
+    ) -> int:
+        """IN transfer of at most 2 bytes, as an unsigned little-endian int."""
+        buf = self._read16_buf
+        _READ16_STRUCT.pack_into(buf, 0, request_type, request, value, index, length)
+        return self._ioctl(_WAVE3_READ16, buf)
+
+    def _run_batch(self, xfers: list[tuple[int, int, int, int, int]]) -> None:
+        """Pack xfers into the batch buffer and run them in one ioctl."""
+        buf = self._batch_buf
+        buf[0] = len(xfers)
+        off = _BATCH_HDR
+        for request_type, request, value, index, length in xfers:
+            _XFER_STRUCT.pack_into(
+                buf, off, request_type, request, value, index, length, b""
+            )
+            off += _XFER_SIZE
+        self._ioctl(_WAVE3_CTL_BATCH, buf)
+
+    def ctrl_read_batch(
+        self, xfers: list[tuple[int, int, int, int, int]]
+    ) -> list[bytes]:
+        """Run up to _BATCH_MAX ctrl_read()s in a single ioctl."""
+        self._run_batch(xfers)
+
+        buf, mv = self._batch_buf, self._batch_mv
+        out = []
+        off = _BATCH_HDR
+        for _ in xfers:
+            resp_len = _LEN_STRUCT.unpack_from(buf, off + 6)[0]
+            data = off + _XFER_DATA
+            out.append(bytes(mv[data : data + resp_len]))
+            off += _XFER_SIZE
+        return out
+
+    def ctrl_read_batch_ints(
+        self, xfers: list[tuple[int, int, int, int, int]]
+    ) -> list[int | None]:
+        """ctrl_read_batch() for 1- and 2-byte reads, decoded in place.
+
+        1-byte responses come back as u8, 2-byte ones as s16 (volume / gain),
+        read straight out of the batch buffer without a bytes copy.  A reply
+        shorter than requested counts as a failed read and comes back as None.
+        """
+        self._run_batch(xfers)
+
+        buf, h = self._batch_buf, self._batch_h
+        out = []
+        off = _BATCH_HDR
+        for x in xfers:
+            length = x[4]
+            data = off + _XFER_DATA
+            if _LEN_STRUCT.unpack_from(buf, off + 6)[0] != length:
+                out.append(None)
+            else:
+                out.append(h[data >> 1] if length == 2 else buf[data])
+            off += _XFER_SIZE
+        return out
 
 
 # ── Wave:3 controller ───────────────────────────────────────────────────
 
 
+class LevelState:
+    """A volume / gain reading."""
+
+    __slots__ = ("raw", "pct", "db")
+
+    def __init__(self, raw: int, pct: int, db: float) -> None:
+        self.raw = raw  # 1/256 dB units, as reported by the device
+        self.pct = pct
+        self.db = db
+
+
 class Wave3:
     def __init__(self) -> None:
+        # No probe transfer here: a missing device fails the first real
+        # transfer with ENODEV anyway, and mute-only commands stay at one ioctl
         self._dev = _DevProxy()
 
-        # Verify communication
-        try:
-            self._get_cur(_MIC_FU, _MUTE, 1)
-        except OSError as e:
-            _die(f"Cannot communicate with Wave:3: {e}")
+    # ── Volume ranges ──
+    #
+    # Fetched on first use (three transfers each) and cached — they never
+    # change.  The scalings are (lo, span, 100 / span) for _raw_pct/_pct_raw.
+    # A failed fetch raises OSError and isn't cached, so the next use retries.
 
-        # Cache volume ranges (they never change)
-        self._hp_range = self._get_range(_HP_FU)
-        self._mic_range = self._get_range(_MIC_FU)
+    @cached_property
+    def _hp_range(self) -> tuple[int, int, int]:
+        return self._get_range(_HP_FU)
+
+    @cached_property
+    def _mic_range(self) -> tuple[int, int, int]:
+        return self._get_range(_MIC_FU)
+
+    @cached_property
+    def _hp_scaling(self) -> tuple[int, int, float]:
+        return self._scaling(self._hp_range)
+
+    @cached_property
+    def _mic_scaling(self) -> tuple[int, int, float]:
+        return self._scaling(self._mic_range)
+
+    def cache_ranges(self) -> None:
+        """Fetch both volume ranges now rather than on first use."""
+        _ = self._hp_scaling, self._mic_scaling
 
     # ── USB transfers ──
 
     def _get_cur(
         self, entity: int, selector: int, length: int, channel: int = 0
-    ) -> bytes:
-        return self._dev.ctrl_transfer(
+    ) -> memoryview:
+        return self._dev.ctrl_read(
             _BM_IN,
             _GET_CUR,
             (selector << 8) | channel,
@@ -136,123 +283,127 @@ class Wave3:
             length,
         )
 
-    def _set_cur(
-        self, entity: int, selector: int, data: bytes, channel: int = 0
-    ) -> None:
-        self._dev.ctrl_transfer(
-            _BM_OUT,
-            _SET_CUR,
-            (selector << 8) | channel,
-            (entity << 8) | _AC_IF,
-            data,
+    def _get_cur_batch(self, reqs: list[tuple[int, int, int]]) -> list[bytes]:
+        """GET_CUR each (wValue, wIndex, length) in reqs with one ioctl."""
+        return self._dev.ctrl_read_batch(
+            [(_BM_IN, _GET_CUR, wV, wI, length) for wV, wI, length in reqs]
+        )
+
+    def _get_cur_batch_ints(self, reqs: list[tuple[int, int, int]]) -> list[int | None]:
+        """_get_cur_batch() decoded as u8 (1-byte) / s16 (2-byte) values."""
+        return self._dev.ctrl_read_batch_ints(
+            [(_BM_IN, _GET_CUR, wV, wI, length) for wV, wI, length in reqs]
         )
 
     def _get_range(self, entity: int, channel: int = 0) -> tuple[int, int, int]:
         wV = (_VOLUME << 8) | channel
         wI = (entity << 8) | _AC_IF
-        try:
-            lo = struct.unpack(
-                "<h", self._dev.ctrl_transfer(_BM_IN, _GET_MIN, wV, wI, 2)
-            )[0]
-            hi = struct.unpack(
-                "<h", self._dev.ctrl_transfer(_BM_IN, _GET_MAX, wV, wI, 2)
-            )[0]
-            res = struct.unpack(
-                "<h", self._dev.ctrl_transfer(_BM_IN, _GET_RES, wV, wI, 2)
-            )[0]
-            return lo, hi, max(res, 1)
-        except OSError:
-            return 0, 0, 1
+        lo = _as_s16(self._dev.read16(_BM_IN, _GET_MIN, wV, wI, 2))
+        hi = _as_s16(self._dev.read16(_BM_IN, _GET_MAX, wV, wI, 2))
+        res = _as_s16(self._dev.read16(_BM_IN, _GET_RES, wV, wI, 2))
+        return lo, hi, max(res, 1)
 
     # ── helpers ──
 
-    def _raw_pct(self, rng: tuple, raw: int) -> int:
+    @staticmethod
+    def _scaling(rng: tuple) -> tuple[int, int, float]:
         lo, hi, _ = rng
-        return max(0, min(100, round((raw - lo) / max(hi - lo, 1) * 100)))
+        return lo, hi - lo, 100.0 / max(hi - lo, 1)
 
-    def _pct_raw(self, rng: tuple, pct: int) -> int:
-        lo, hi, _ = rng
-        return int(lo + (hi - lo) * max(0, min(100, pct)) / 100)
+    @staticmethod
+    def _raw_pct(lo: int, to_pct: float, raw: int) -> int:
+        pct = int((raw - lo) * to_pct + 0.5)
+        if pct < 0:
+            return 0
+        if pct > 100:
+            return 100
+        return pct
+
+    @staticmethod
+    def _pct_raw(lo: int, span: int, pct: int) -> int:
+        if pct < 0:
+            pct = 0
+        elif pct > 100:
+            pct = 100
+        return int(lo + span * pct / 100)
 
     @staticmethod
     def _db(raw: int) -> float:
         return raw / 256.0
 
+    def _level(self, lo: int, to_pct: float, raw: int) -> LevelState:
+        return LevelState(raw, self._raw_pct(lo, to_pct, raw), self._db(raw))
+
     # ── Mic Mute (Entity 6) ──
 
     def get_mic_mute(self) -> bool | None:
         try:
-            return bool(self._get_cur(_MIC_FU, _MUTE, 1)[0])
+            return bool(self._dev.read16(_BM_IN, _GET_CUR, _WV_MUTE, _WI_MIC, 1))
         except OSError:
             return None
 
     def set_mic_mute(self, muted: bool) -> bool:
         try:
-            self._set_cur(_MIC_FU, _MUTE, bytes([int(muted)]))
+            self._dev.ctrl_write(_BM_OUT, _SET_CUR, _WV_MUTE, _WI_MIC, bytes([muted]))
             return True
         except OSError:
             return False
 
     def toggle_mic_mute(self) -> bool | None:
         cur = self.get_mic_mute()
-        if cur is None:
+        if cur is None or not self.set_mic_mute(not cur):
             return None
-        self.set_mic_mute(not cur)
         return not cur
 
     # ── HP Mute (Entity 5) ──
 
     def get_hp_mute(self) -> bool | None:
         try:
-            return bool(self._get_cur(_HP_FU, _MUTE, 1)[0])
+            return bool(self._dev.read16(_BM_IN, _GET_CUR, _WV_MUTE, _WI_HP, 1))
         except OSError:
             return None
 
     def set_hp_mute(self, muted: bool) -> bool:
         try:
-            self._set_cur(_HP_FU, _MUTE, bytes([int(muted)]))
+            self._dev.ctrl_write(_BM_OUT, _SET_CUR, _WV_MUTE, _WI_HP, bytes([muted]))
             return True
         except OSError:
             return False
 
     # ── HP Volume (Entity 5) ──
 
-    def get_volume(self) -> dict | None:
+    def get_volume(self) -> LevelState | None:
         try:
-            raw = struct.unpack("<h", self._get_cur(_HP_FU, _VOLUME, 2))[0]
-            return {
-                "raw": raw,
-                "pct": self._raw_pct(self._hp_range, raw),
-                "db": self._db(raw),
-            }
+            raw = _as_s16(self._dev.read16(_BM_IN, _GET_CUR, _WV_VOLUME, _WI_HP, 2))
+            lo, _, to_pct = self._hp_scaling
+            return self._level(lo, to_pct, raw)
         except OSError:
             return None
 
     def set_volume_pct(self, pct: int) -> bool:
-        raw = self._pct_raw(self._hp_range, pct)
         try:
-            self._set_cur(_HP_FU, _VOLUME, struct.pack("<h", raw))
+            lo, span, _ = self._hp_scaling
+            raw = self._pct_raw(lo, span, pct)
+            self._dev.ctrl_write(_BM_OUT, _SET_CUR, _WV_VOLUME, _WI_HP, _S16.pack(raw))
             return True
         except OSError:
             return False
 
     # ── Mic Gain (Entity 6) ──
 
-    def get_mic_gain(self) -> dict | None:
+    def get_mic_gain(self) -> LevelState | None:
         try:
-            raw = struct.unpack("<h", self._get_cur(_MIC_FU, _VOLUME, 2))[0]
-            return {
-                "raw": raw,
-                "pct": self._raw_pct(self._mic_range, raw),
-                "db": self._db(raw),
-            }
+            raw = _as_s16(self._dev.read16(_BM_IN, _GET_CUR, _WV_VOLUME, _WI_MIC, 2))
+            lo, _, to_pct = self._mic_scaling
+            return self._level(lo, to_pct, raw)
         except OSError:
             return None
 
     def set_mic_gain_pct(self, pct: int) -> bool:
-        raw = self._pct_raw(self._mic_range, pct)
         try:
-            self._set_cur(_MIC_FU, _VOLUME, struct.pack("<h", raw))
+            lo, span, _ = self._mic_scaling
+            raw = self._pct_raw(lo, span, pct)
+            self._dev.ctrl_write(_BM_OUT, _SET_CUR, _WV_VOLUME, _WI_MIC, _S16.pack(raw))
             return True
         except OSError:
             return False
@@ -262,38 +413,95 @@ class Wave3:
 
 
 def cmd_status(w: Wave3) -> None:
+    mm, g = w.get_mic_mute(), w.get_mic_gain()
+    hm, v = w.get_hp_mute(), w.get_volume()
+    if mm is None and g is None and hm is None and v is None:
+        _die("Cannot communicate with Wave:3")
     print("Elgato Wave:3 Status")
     print("=" * 40)
-    mm = w.get_mic_mute()
     if mm is not None:
         print(f"  Mic:       {'🔇 MUTED' if mm else '🎤 LIVE'}")
-    g = w.get_mic_gain()
     if g:
-        print(f"  Mic Gain:  {g['pct']}% ({g['db']:+.1f} dB)")
-    hm = w.get_hp_mute()
+        print(f"  Mic Gain:  {g.pct}% ({g.db:+.1f} dB)")
     if hm is not None:
         print(f"  Headphone: {'🔇 MUTED' if hm else '🔊 ON'}")
-    v = w.get_volume()
     if v:
-        print(f"  HP Volume: {v['pct']}% ({v['db']:+.1f} dB)")
+        print(f"  HP Volume: {v.pct}% ({v.db:+.1f} dB)")
+
+
+def cmd_mute(w: Wave3, args: list[str]) -> None:
+    if args:
+        arg = args[0].lower()
+        if arg in ("on", "true", "1"):
+            muted = True
+        elif arg in ("off", "false", "0"):
+            muted = False
+        else:
+            _die(f"Bad argument '{arg}' — use on / off")
+        if not w.set_mic_mute(muted):
+            _die("Cannot set mic mute")
+        print("🔇 Mic muted" if muted else "🎤 Mic unmuted")
+    else:
+        r = w.toggle_mic_mute()
+        if r is not None:
+            print("🔇 Mic muted" if r else "🎤 Mic unmuted")
+        else:
+            _die("Cannot toggle mic mute")
+
+
+def cmd_level(w: Wave3, cmd: str, args: list[str]) -> None:
+    setter, getter, label = _LEVEL_CMDS[cmd]
+    if args:
+        try:
+            pct = int(args[0])
+        except ValueError:
+            _die(f"Not a number: {args[0]}")
+        pct = max(0, min(100, pct))
+        if not getattr(w, setter)(pct):
+            _die(f"Cannot set {cmd}")
+        print(f"{label} → {pct}%")
+    else:
+        lv = getattr(w, getter)()
+        if lv:
+            print(f"{label}: {lv.pct}% ({lv.db:+.1f} dB)")
+        else:
+            _die(f"Cannot read {cmd}")
 
 
 def cmd_discover(w: Wave3) -> None:
     print("Elgato Wave:3 — USB Audio Class Feature Units\n")
-    for fu, label, rng in [
-        (_HP_FU, "Headphone (Entity 5)", w._hp_range),
-        (_MIC_FU, "Microphone (Entity 6)", w._mic_range),
+
+    # Read every current value in one batch; a control that fails or answers
+    # short (None) is probed on its own so the failing one can be reported
+    reqs = [
+        (_WV_MUTE, _WI_HP, 1),
+        (_WV_VOLUME, _WI_HP, 2),
+        (_WV_MUTE, _WI_MIC, 1),
+        (_WV_VOLUME, _WI_MIC, 2),
+    ]
+    try:
+        cur = dict(zip(reqs, w._get_cur_batch_ints(reqs)))
+    except OSError:
+        cur = {}
+
+    for wI, label, rng_attr, scaling_attr in [
+        (_WI_HP, "Headphone (Entity 5)", "_hp_range", "_hp_scaling"),
+        (_WI_MIC, "Microphone (Entity 6)", "_mic_range", "_mic_scaling"),
     ]:
         print(f"  {label}:")
         try:
-            d = w._get_cur(fu, _MUTE, 1)
-            print(f"    Mute:   {'ON 🔇' if d[0] else 'OFF 🔊'}")
+            m = cur.get((_WV_MUTE, wI, 1))
+            if m is None:
+                m = w._dev.read16(_BM_IN, _GET_CUR, _WV_MUTE, wI, 1)
+            print(f"    Mute:   {'ON 🔇' if m else 'OFF 🔊'}")
         except OSError:
             print("    Mute:   (unavailable)")
         try:
-            raw = struct.unpack("<h", w._get_cur(fu, _VOLUME, 2))[0]
-            lo, hi, res = rng
-            pct = w._raw_pct(rng, raw)
+            raw = cur.get((_WV_VOLUME, wI, 2))
+            if raw is None:
+                raw = _as_s16(w._dev.read16(_BM_IN, _GET_CUR, _WV_VOLUME, wI, 2))
+            lo, hi, res = getattr(w, rng_attr)
+            pct = w._raw_pct(lo, getattr(w, scaling_attr)[2], raw)
             print(f"    Volume: {pct}% ({raw / 256:+.1f} dB)")
             print(
                 f"    Range:  {lo / 256:.1f} … {hi / 256:.1f} dB"
@@ -304,7 +512,32 @@ def cmd_discover(w: Wave3) -> None:
         print()
 
 
+def _raise_priority() -> None:
+    """Best effort: keep the monitor's wake-ups on time under load.
+
+    SCHED_FIFO needs CAP_SYS_NICE (root); a negative nice value is the
+    fallback.  Without either the monitor just runs at normal priority.
+    """
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(1))
+        return
+    except OSError:
+        pass
+    try:
+        os.nice(-5)
+    except OSError:
+        pass
+
+
 def cmd_monitor(w: Wave3) -> None:
+    _raise_priority()
+    try:
+        _monitor(w)
+    except KeyboardInterrupt:
+        print("\nStopped.")
+
+
+def _monitor(w: Wave3) -> None:
     print("Monitoring Wave:3 — Ctrl-C to stop\n")
 
     last_mm = w.get_mic_mute()
@@ -316,112 +549,249 @@ def cmd_monitor(w: Wave3) -> None:
     if last_mm is not None:
         print(f"  Mic:    {'🔇 MUTED' if last_mm else '🎤 LIVE'}")
     if last_gain:
-        print(f"  Gain:   {last_gain['pct']}% ({last_gain['db']:+.1f} dB)")
+        print(f"  Gain:   {last_gain.pct}% ({last_gain.db:+.1f} dB)")
     if last_hm is not None:
         print(f"  HP:     {'🔇 MUTED' if last_hm else '🔊 ON'}")
     if last_vol:
-        print(f"  Volume: {last_vol['pct']}% ({last_vol['db']:+.1f} dB)")
+        print(f"  Volume: {last_vol.pct}% ({last_vol.db:+.1f} dB)")
     print()
 
+    # Change detection works on the raw values; nothing is formatted unless
+    # a value actually changed
+    last_vol_raw = last_vol.raw if last_vol else None
+    last_gain_raw = last_gain.raw if last_gain else None
+    try:
+        hp_lo, _, hp_to_pct = w._hp_scaling
+        mic_lo, _, mic_to_pct = w._mic_scaling
+    except OSError:
+        _die("Cannot read volume ranges")
+
+    # Change lines, prebuilt / indexed by the new mute state
+    mic_msg = ("  🎤 Mic  → LIVE 🎤", "  🎤 Mic  → MUTED 🔇")
+    hp_msg = ("  🎧 HP   → ON 🔊", "  🎧 HP   → MUTED 🔇")
+    vol_fmt = "  🔊 Vol  → {}% ({:+.1f} dB)".format
+    gain_fmt = "  🎤 Gain → {}% ({:+.1f} dB)".format
+
+    # All four controls are read with a single batched ioctl per tick
+    poll = [
+        (_WV_MUTE, _WI_MIC, 1),
+        (_WV_MUTE, _WI_HP, 1),
+        (_WV_VOLUME, _WI_HP, 2),
+        (_WV_VOLUME, _WI_MIC, 2),
+    ]
+
+    # Sleep to a fixed monotonic schedule so USB and print time don't
+    # stretch the period
+    next_t = time.monotonic()
     while True:
-        time.sleep(0.2)
+        next_t += _POLL_INTERVAL
+        dt = next_t - time.monotonic()
+        if dt > 0:
+            time.sleep(dt)
+        else:
+            next_t = time.monotonic()  # fell behind (e.g. suspend) — no burst
         try:
-            mm = w.get_mic_mute()
-            if mm is not None and mm != last_mm:
-                print(f"  🎤 Mic  → {'MUTED 🔇' if mm else 'LIVE 🎤'}")
-                last_mm = mm
-
-            hm = w.get_hp_mute()
-            if hm is not None and hm != last_hm:
-                print(f"  🎧 HP   → {'MUTED 🔇' if hm else 'ON 🔊'}")
-                last_hm = hm
-
-            vol = w.get_volume()
-            if vol and last_vol and vol["raw"] != last_vol["raw"]:
-                print(f"  🔊 Vol  → {vol['pct']}% ({vol['db']:+.1f} dB)")
-                last_vol = vol
-
-            gain = w.get_mic_gain()
-            if gain and last_gain and gain["raw"] != last_gain["raw"]:
-                print(f"  🎤 Gain → {gain['pct']}% ({gain['db']:+.1f} dB)")
-                last_gain = gain
+            mm, hm, vol_raw, gain_raw = w._get_cur_batch_ints(poll)
         except OSError:
-            pass  # transient USB error — retry next cycle
+            # The batch stops at the first failing control; read them one by
+            # one so a stalled control doesn't hide changes to the others
+            mm, hm = w.get_mic_mute(), w.get_hp_mute()
+            vol, gain = w.get_volume(), w.get_mic_gain()
+            vol_raw = vol.raw if vol else None
+            gain_raw = gain.raw if gain else None
+
+        # None = that control couldn't be read this tick
+        if mm is not None and bool(mm) != last_mm:
+            last_mm = bool(mm)
+            print(mic_msg[last_mm])
+
+        if hm is not None and bool(hm) != last_hm:
+            last_hm = bool(hm)
+            print(hp_msg[last_hm])
+
+        if vol_raw is not None and vol_raw != last_vol_raw:
+            pct = w._raw_pct(hp_lo, hp_to_pct, vol_raw)
+            print(vol_fmt(pct, w._db(vol_raw)))
+            last_vol_raw = vol_raw
+
+        if gain_raw is not None and gain_raw != last_gain_raw:
+            pct = w._raw_pct(mic_lo, mic_to_pct, gain_raw)
+            print(gain_fmt(pct, w._db(gain_raw)))
+            last_gain_raw = gain_raw
+
+
+# ── Daemon ───────────────────────────────────────────────────────────────
+#
+# The daemon keeps /dev/wave3ctl open with the volume ranges cached, so a
+# client invocation skips the USB round trips of Wave3.__init__.  The client
+# sends its argv and passes its stdout/stderr along (SCM_RIGHTS); a forked
+# child runs the command straight onto them and the daemon replies with the
+# one-byte exit status.
+#
+# Whether the daemon or the client runs the command is settled by a two-way
+# handshake, so it never runs twice: the daemon acks with b"+", and forks only
+# once the client answers with b"+" in turn.  A client that gets no ack in
+# time closes the connection and runs the command itself; once it has sent
+# its b"+" it leaves the command to the daemon and only waits for the status.
+
+
+def _daemon_socket() -> socket.socket:
+    # systemd socket activation (Accept=no) hands us the listening socket
+    if os.environ.get("LISTEN_PID") == str(os.getpid()):
+        if int(os.environ.get("LISTEN_FDS", "0")) >= 1:
+            return socket.socket(fileno=_SD_LISTEN_FDS_START)
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        os.unlink(_SOCK_PATH)
+    except FileNotFoundError:
+        pass
+    try:
+        sock.bind(_SOCK_PATH)
+    except OSError as e:
+        _die(f"{_SOCK_PATH}: {e.strerror}")
+    os.chmod(_SOCK_PATH, 0o666)  # same access as /dev/wave3ctl
+    sock.listen()
+    return sock
+
+
+def _serve_one(w: Wave3, conn: socket.socket) -> None:
+    # A client that connects and sends nothing must not stall the others
+    conn.settimeout(_SOCK_TIMEOUT)
+    msg, fds, _, _ = socket.recv_fds(conn, 4096, 2)
+    try:
+        if not msg or len(fds) != 2:
+            return
+        try:
+            args = msg.decode().split("\0")
+        except UnicodeDecodeError:
+            return
+        # Never fork long-running commands (monitor) here; dropping the
+        # connection without an ack sends the client down the direct path
+        if args[0].lower() not in _DAEMON_CMDS:
+            return
+        conn.sendall(b"+")
+        if conn.recv(1) != b"+":
+            return  # client gave up waiting for the ack and runs it itself
+
+        pid = os.fork()
+        if pid == 0:
+            status = 0
+            try:
+                os.dup2(fds[0], 1)
+                os.dup2(fds[1], 2)
+                _dispatch(w, args)
+            except SystemExit as e:
+                status = e.code if isinstance(e.code, int) else 1
+            except BaseException:
+                traceback.print_exc()
+                status = 1
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(status)
+    finally:
+        for fd in fds:
+            os.close(fd)
+
+    # One request at a time — transfers are never interleaved on the device
+    status = os.waitstatus_to_exitcode(os.waitpid(pid, 0)[1])
+    conn.sendall(bytes([status if 0 <= status < 256 else 1]))
+
+
+def cmd_daemon(w: Wave3) -> None:
+    sock = _daemon_socket()
+    try:
+        w.cache_ranges()  # once here, inherited by every forked request
+    except OSError:
+        pass  # left uncached: each request fetches them again until one works
+    while True:
+        conn, _ = sock.accept()
+        with conn:
+            try:
+                _serve_one(w, conn)
+            except OSError:
+                pass  # client went away — nothing to report
 
 
-def main() -> None:
-    if len(sys.argv) < 2 or sys.argv[1] in ("-h", "--help", "help"):
-        print(__doc__.strip())
-        sys.exit(0 if len(sys.argv) > 1 else 1)
+def _via_daemon(args: list[str]) -> int | None:
+    """Run args on the daemon; None if it didn't take the request."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    with sock:
+        sock.settimeout(_SOCK_TIMEOUT)
+        try:
+            sock.connect(_SOCK_PATH)
+            socket.send_fds(sock, ["\0".join(args).encode()], [1, 2])
+            ack = sock.recv(1)
+        except OSError:  # includes timeouts — busy, stuck or no daemon
+            return None
+        if ack != b"+":
+            return None
+        try:
+            sock.sendall(b"+")
+        except OSError:
+            return None
 
-    cmd = sys.argv[1].lower()
-    w = Wave3()
+        # Committed: the daemon runs the command (bounded by the USB
+        # timeouts) or, if it missed our b"+", nothing runs — never both
+        sock.settimeout(None)
+        try:
+            status = sock.recv(1)
+        except OSError:
+            return 1
+    return status[0] if status else 1
 
-    if cmd == "status":
-        cmd_status(w)
 
-    elif cmd == "discover":
-        cmd_discover(w)
+# ── Entry point ──────────────────────────────────────────────────────────
 
-    elif cmd == "mute":
-        if len(sys.argv) > 2:
-            arg = sys.argv[2].lower()
-            if arg in ("on", "true", "1"):
-                w.set_mic_mute(True)
-                print("🔇 Mic muted")
-            elif arg in ("off", "false", "0"):
-                w.set_mic_mute(False)
-                print("🎤 Mic unmuted")
-            else:
-                _die(f"Bad argument '{arg}' — use on / off")
-        else:
-            r = w.toggle_mic_mute()
-            if r is not None:
-                print("🔇 Mic muted" if r else "🎤 Mic unmuted")
-            else:
-                _die("Cannot read mic mute state")
 
-    elif cmd == "volume":
-        if len(sys.argv) > 2:
-            try:
-                pct = int(sys.argv[2])
-            except:
-                _die(f"Not a number: {sys.argv[2]}")
-            pct = max(0, min(100, pct))
-            w.set_volume_pct(pct)
-            print(f"🔊 Volume → {pct}%")
-        else:
-            v = w.get_volume()
-            if v:
-                print(f"🔊 Volume: {v['pct']}% ({v['db']:+.1f} dB)")
-            else:
-                _die("Cannot read volume")
+# Commands that only take the device
+_COMMANDS = {
+    "status": cmd_status,
+    "discover": cmd_discover,
+    "monitor": cmd_monitor,
+}
 
-    elif cmd == "gain":
-        if len(sys.argv) > 2:
-            try:
-                pct = int(sys.argv[2])
-            except:
-                _die(f"Not a number: {sys.argv[2]}")
-            pct = max(0, min(100, pct))
-            w.set_mic_gain_pct(pct)
-            print(f"🎤 Gain → {pct}%")
-        else:
-            g = w.get_mic_gain()
-            if g:
-                print(f"🎤 Gain: {g['pct']}% ({g['db']:+.1f} dB)")
-            else:
-                _die("Cannot read gain")
+# Level commands: name → (setter, getter, label)
+_LEVEL_CMDS = {
+    "volume": ("set_volume_pct", "get_volume", "🔊 Volume"),
+    "gain": ("set_mic_gain_pct", "get_mic_gain", "🎤 Gain"),
+}
 
-    elif cmd == "monitor":
-        try:
-            cmd_monitor(w)
-        except KeyboardInterrupt:
-            print("\nStopped.")
 
+def _dispatch(w: Wave3, args: list[str]) -> None:
+    cmd = args[0].lower()
+
+    fn = _COMMANDS.get(cmd)
+    if fn is not None:
+        fn(w)
+    elif cmd == "mute":
+        cmd_mute(w, args[1:])
+    elif cmd in _LEVEL_CMDS:
+        cmd_level(w, cmd, args[1:])
     else:
         _die(f"Unknown command '{cmd}' — run with --help")
 
 
+def main() -> None:
+    if len(sys.argv) < 2 or sys.argv[1] in ("-h", "--help", "help"):
+        print(__doc__.strip())
+        sys.exit(0 if len(sys.argv) > 1 else 1)
+
+    args = sys.argv[1:]
+
+    if args[0] == "--daemon":
+        cmd_daemon(Wave3())
+        return
+
+    # Hand off one-shot commands to a running daemon if there is one
+    if args[0].lower() in _DAEMON_CMDS:
+        status = _via_daemon(args)
+        if status is not None:
+            sys.exit(status)
+
+    _dispatch(Wave3(), args)
+
+
 if __name__ == "__main__":
     main()
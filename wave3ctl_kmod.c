@@ -20,10 +20,30 @@ struct wave3_xfer {
 	__u16 value;
 	__u16 index;
 	__u16 length;       /* in: max bytes; out: actual bytes */
+	__u8  reserved[8];  /* 16-byte header keeps data[] 16-byte aligned */
 	__u8  data[64];
 } __packed;
 
-#define WAVE3_CTL _IOWR('W', 0, struct wave3_xfer)
+/* Short IN transfer (<= 2 bytes): the value comes back as the ioctl result */
+struct wave3_read16 {
+	__u8  request_type;
+	__u8  request;
+	__u16 value;
+	__u16 index;
+	__u16 length;
+} __packed;
+
+#define WAVE3_BATCH_MAX 8
+
+struct wave3_batch {
+	__u8  n;            /* number of xfers[] in use */
+	__u8  reserved[15]; /* keeps xfers[] (and their data[]) 16-byte aligned */
+	struct wave3_xfer xfers[WAVE3_BATCH_MAX];
+} __packed;
+
+#define WAVE3_CTL       _IOWR('W', 0, struct wave3_xfer)
+#define WAVE3_CTL_BATCH _IOWR('W', 1, struct wave3_batch)
+#define WAVE3_READ16    _IOWR('W', 2, struct wave3_read16)
 
 /* ── find the Wave:3 on the USB bus ────────────────────────────── */
 
@@ -41,20 +61,47 @@ static int match_wave3(struct usb_device *dev, void *data)
 	return 0;
 }
 
-/* ── ioctl handler ─────────────────────────────────────────────── */
+/* ── control transfers ─────────────────────────────────────────── */
 
-static long wave3_ioctl(struct file *filp, unsigned int cmd,
-			unsigned long arg)
+/*
+ * Run one transfer.  buf must hold sizeof(xfer->data) bytes.
+ * On success IN transfers have data/length filled in.
+ */
+static int wave3_xfer(struct usb_device *dev, struct wave3_xfer *xfer,
+		      unsigned char *buf)
+{
+	unsigned int pipe;
+	int ret;
+
+	if (xfer->request_type & USB_DIR_IN) {
+		pipe = usb_rcvctrlpipe(dev, 0);
+	} else {
+		pipe = usb_sndctrlpipe(dev, 0);
+		memcpy(buf, xfer->data, xfer->length);
+	}
+
+	ret = usb_control_msg(dev, pipe,
+			      xfer->request, xfer->request_type,
+			      xfer->value, xfer->index,
+			      buf, xfer->length, 1000 /* ms */);
+
+	if (ret >= 0 && (xfer->request_type & USB_DIR_IN)) {
+		xfer->length = ret;
+		memcpy(xfer->data, buf, ret);
+	}
+	return ret < 0 ? ret : 0;
+}
+
+/* ── ioctl handlers ────────────────────────────────────────────── */
+
+static long wave3_ioctl_ctl(void __user *arg)
 {
 	struct wave3_xfer xfer;
 	struct find_ctx ctx = { .dev = NULL };
 	unsigned char *buf;
-	unsigned int pipe;
 	int ret;
 
-	if (cmd != WAVE3_CTL)
-		return -ENOTTY;
-	if (copy_from_user(&xfer, (void __user *)arg, sizeof(xfer)))
+	if (copy_from_user(&xfer, arg, sizeof(xfer)))
 		return -EFAULT;
 	if (xfer.length > sizeof(xfer.data))
 		return -EINVAL;
@@ -63,34 +110,121 @@ static long wave3_ioctl(struct file *filp, unsigned int cmd,
 	if (!ctx.dev)
 		return -ENODEV;
 
-	buf = kmalloc(xfer.length, GFP_KERNEL);
+	buf = kmalloc(sizeof(xfer.data), GFP_KERNEL);
 	if (!buf) { ret = -ENOMEM; goto put; }
 
-	if (xfer.request_type & USB_DIR_IN) {
-		pipe = usb_rcvctrlpipe(ctx.dev, 0);
-	} else {
-		pipe = usb_sndctrlpipe(ctx.dev, 0);
-		memcpy(buf, xfer.data, xfer.length);
-	}
+	ret = wave3_xfer(ctx.dev, &xfer, buf);
 
-	ret = usb_control_msg(ctx.dev, pipe,
-			      xfer.request, xfer.request_type,
-			      xfer.value, xfer.index,
-			      buf, xfer.length, 1000 /* ms */);
-
-	if (ret >= 0 && (xfer.request_type & USB_DIR_IN)) {
-		xfer.length = ret;
-		memcpy(xfer.data, buf, ret);
-		if (copy_to_user((void __user *)arg, &xfer, sizeof(xfer)))
-			ret = -EFAULT;
-		else
-			ret = 0;
-	}
+	if (ret == 0 && (xfer.request_type & USB_DIR_IN) &&
+	    copy_to_user(arg, &xfer, sizeof(xfer)))
+		ret = -EFAULT;
 
 	kfree(buf);
 put:
 	usb_put_dev(ctx.dev);
-	return ret < 0 ? ret : 0;
+	return ret;
+}
+
+/*
+ * Run up to WAVE3_BATCH_MAX transfers back-to-back in one syscall.
+ * Stops at the first failing transfer and returns its error.
+ */
+static long wave3_ioctl_batch(void __user *arg)
+{
+	struct wave3_batch *batch;
+	struct find_ctx ctx = { .dev = NULL };
+	unsigned char *buf;
+	int i, ret;
+
+	batch = memdup_user(arg, sizeof(*batch));
+	if (IS_ERR(batch))
+		return PTR_ERR(batch);
+
+	ret = -EINVAL;
+	if (batch->n > WAVE3_BATCH_MAX)
+		goto out;
+	for (i = 0; i < batch->n; i++)
+		if (batch->xfers[i].length > sizeof(batch->xfers[i].data))
+			goto out;
+
+	usb_for_each_dev(&ctx, match_wave3);
+	ret = -ENODEV;
+	if (!ctx.dev)
+		goto out;
+
+	buf = kmalloc(sizeof(batch->xfers[0].data), GFP_KERNEL);
+	if (!buf) { ret = -ENOMEM; goto put; }
+
+	for (i = 0, ret = 0; i < batch->n && ret == 0; i++)
+		ret = wave3_xfer(ctx.dev, &batch->xfers[i], buf);
+
+	if (ret == 0 && copy_to_user(arg, batch, sizeof(*batch)))
+		ret = -EFAULT;
+
+	kfree(buf);
+put:
+	usb_put_dev(ctx.dev);
+out:
+	kfree(batch);
+	return ret;
+}
+
+/*
+ * Returns the (little-endian) response bytes as a non-negative integer,
+ * so nothing has to be copied back to userspace.  A reply shorter than
+ * req.length fails with -EPROTO.
+ */
+static long wave3_ioctl_read16(void __user *arg)
+{
+	struct wave3_read16 req;
+	struct wave3_xfer xfer = { 0 };
+	struct find_ctx ctx = { .dev = NULL };
+	unsigned char *buf;
+	int ret;
+
+	if (copy_from_user(&req, arg, sizeof(req)))
+		return -EFAULT;
+	if (!(req.request_type & USB_DIR_IN) || req.length > 2)
+		return -EINVAL;
+
+	xfer.request_type = req.request_type;
+	xfer.request      = req.request;
+	xfer.value        = req.value;
+	xfer.index        = req.index;
+	xfer.length       = req.length;
+
+	usb_for_each_dev(&ctx, match_wave3);
+	if (!ctx.dev)
+		return -ENODEV;
+
+	buf = kmalloc(sizeof(xfer.data), GFP_KERNEL);
+	if (!buf) { ret = -ENOMEM; goto put; }
+
+	ret = wave3_xfer(ctx.dev, &xfer, buf);
+	if (ret == 0 && xfer.length != req.length)
+		ret = -EPROTO;	/* short reply: don't pass zero-fill off as data */
+	if (ret == 0)
+		ret = xfer.data[0] | (xfer.data[1] << 8);
+
+	kfree(buf);
+put:
+	usb_put_dev(ctx.dev);
+	return ret;
+}
+
+static long wave3_ioctl(struct file *filp, unsigned int cmd,
+			unsigned long arg)
+{
+	switch (cmd) {
+	case WAVE3_CTL:
+		return wave3_ioctl_ctl((void __user *)arg);
+	case WAVE3_CTL_BATCH:
+		return wave3_ioctl_batch((void __user *)arg);
+	case WAVE3_READ16:
+		return wave3_ioctl_read16((void __user *)arg);
+	default:
+		return -ENOTTY;
+	}
 }
 
 /* ── misc device setup ─────────────────────────────────────────── */